@@ -1,7 +1,13 @@
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import io
+from datetime import datetime
 import json
-import re
+import orjson
 
 # Page configuration
 st.set_page_config(
@@ -11,29 +17,15 @@ st.set_page_config(
 )
 
 # --- Helper functions for parsing iOS roles and capabilities
-def parse_ios_roles(roles_list):
-    """Parse iOS roles list into a readable format"""
-    if not roles_list or roles_list == 'None':
-        return []
-    return [role.strip().upper() for role in roles_list if role.strip()]
-
-def format_ios_roles_for_display(roles):
-    """Format iOS roles list for better readability"""
-    if not roles:
-        return "None"
-    return ', '.join(roles)
-
 def get_visible_apps_count(visible_apps_data):
     """Extract the total number of visible apps from the API response"""
-    if not visible_apps_data or 'meta' not in visible_apps_data:
+    try:
+        return int(visible_apps_data['meta']['paging']['total'])
+    except (KeyError, TypeError, ValueError):
         return 0
-    return visible_apps_data.get('meta', {}).get('paging', {}).get('total', 0)
 
 def prepare_export_data(df):
     """Prepare data for export with all analysis columns"""
-    export_df = df.copy()
-    # Convert roles list to string for CSV export
-    export_df['Roles_String'] = export_df['Parsed_Roles'].apply(lambda x: ', '.join(x) if x else 'None')
     export_columns = {
         'Email': 'Email',
         'FirstName': 'First Name',
@@ -47,8 +39,19 @@ def prepare_export_data(df):
         'emailVettingRequired': 'Email Vetting Required',
         'VisibleAppsCount': 'Visible Apps Count',
     }
-    export_df = export_df[list(export_columns.keys())].rename(columns=export_columns)
-    return export_df
+    # Column selection already returns a new frame, so no full copy is needed
+    return df[list(export_columns.keys())].rename(columns=export_columns)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_csv(df_signature, _df):
+    """Serialize an export DataFrame to CSV bytes with Arrow's native writer, once per signature"""
+    # Arrow writes booleans as true/false; keep the True/False spelling of the original pandas export
+    bool_columns = _df.select_dtypes(include=bool).columns
+    export_df = _df.assign(**{col: np.where(_df[col].to_numpy(), 'True', 'False') for col in bool_columns})
+    buffer = io.BytesIO()
+    table = pa.Table.from_pandas(export_df, preserve_index=False)
+    pa_csv.write_csv(table, buffer, pa_csv.WriteOptions(quoting_style='needed'))
+    return buffer.getvalue()
 
 # Initialize dangerous iOS roles in session state
 def initialize_dangerous_ios_roles():
@@ -67,76 +70,141 @@ def get_dangerous_ios_roles():
     initialize_dangerous_ios_roles()
     return st.session_state.dangerous_ios_roles
 
-def has_dangerous_ios_role(user_roles):
-    dangerous_roles = get_dangerous_ios_roles()
-    for role in user_roles:
-        if role in dangerous_roles:
-            return True
-    return False
+def get_normalized_dangerous_ios_roles():
+    """Uppercase frozenset of the monitored roles, usable as a cache key"""
+    return frozenset(role.upper() for role in get_dangerous_ios_roles())
+
+def compute_dangerous_mask(parsed_roles, dangerous_roles):
+    """Return a boolean mask of users holding at least one dangerous role"""
+    return ~parsed_roles.map(dangerous_roles.isdisjoint).to_numpy(dtype=bool)
 
-def analyze_ios_user(row):
-    reasons = []
-    if row['allAppsVisible']:
-        reasons.append('Can see all apps')
-    if row['provisioningAllowed']:
-        reasons.append('Can manage certificates/provisioning')
-    if has_dangerous_ios_role(row['Parsed_Roles']):
-        reasons.append('Has dangerous roles')
-    return ', '.join(reasons) if reasons else 'Normal'
+def compute_dangerous_bitmask(role_masks, role_bits, dangerous_roles):
+    """Test each user's packed role bitmask against the dangerous roles with one vectorized AND"""
+    danger_bits = 0
+    for role in dangerous_roles:
+        danger_bits |= role_bits.get(role, 0)
+    return (role_masks.to_numpy() & np.uint64(danger_bits)) != 0
+
+def analyze_ios_users(df, dangerous):
+    """Build the access review summary for all users using column-wise masks"""
+    all_apps = df['allAppsVisible'].to_numpy(dtype=bool)
+    provisioning = df['provisioningAllowed'].to_numpy(dtype=bool)
+    reasons = np.full(len(df), '', dtype=object)
+    reasons = np.where(all_apps, reasons + ', Can see all apps', reasons)
+    reasons = np.where(provisioning, reasons + ', Can manage certificates/provisioning', reasons)
+    reasons = np.where(dangerous, reasons + ', Has dangerous roles', reasons)
+    reasons = pd.Series(reasons, index=df.index, dtype=object).str.removeprefix(', ')
+    return reasons.mask(reasons == '', 'Normal')
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_access_review(df_version, dangerous_roles, _df, _role_bits):
+    """Compute the role-dependent columns, memoized per upload and monitored role set"""
+    # _role_bits is None when the upload had too many distinct roles to pack into RoleMask
+    if _role_bits is not None:
+        dangerous = compute_dangerous_bitmask(_df['RoleMask'], _role_bits, dangerous_roles)
+    else:
+        dangerous = compute_dangerous_mask(_df['Parsed_Roles'], dangerous_roles)
+    return pd.DataFrame({
+        'has_dangerous': dangerous,
+        'Access Review': analyze_ios_users(_df, dangerous),
+    }, index=_df.index)
+
+def refresh_dangerous_flags(df, norm_dangerous=None):
+    """Recompute the role-dependent columns only when the monitored roles change"""
+    signature = norm_dangerous if norm_dangerous is not None else get_normalized_dangerous_ios_roles()
+    if 'has_dangerous' not in df or st.session_state.get('dangerous_roles_signature') != signature:
+        review = compute_access_review(
+            st.session_state.get('df_version'), signature, df, st.session_state.get('role_bits')
+        )
+        df[review.columns] = review
+        st.session_state.dangerous_roles_signature = signature
 
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={UploadedFile: lambda f: f.getvalue()})
 def load_and_process_ios_data(uploaded_file):
-    """Load and process the uploaded iOS JSON file"""
+    """Load and process the uploaded iOS JSON file, returning the DataFrame and its role-to-bit map"""
     try:
-        data = json.load(uploaded_file)
+        data = orjson.loads(uploaded_file.getvalue())
         users_data = data.get('data', [])
         
-        # Convert to DataFrame
-        processed_users = []
-        for user in users_data:
-            attributes = user.get('attributes', {})
-            relationships = user.get('relationships', {})
-            
-            processed_user = {
-                'Email': attributes.get('email', ''),
-                'Username': attributes.get('username', ''),
-                'FirstName': attributes.get('firstName', ''),
-                'LastName': attributes.get('lastName', ''),
-                'Roles': attributes.get('roles', []),
-                'allAppsVisible': attributes.get('allAppsVisible', False),
-                'provisioningAllowed': attributes.get('provisioningAllowed', False),
-                'emailVettingRequired': attributes.get('emailVettingRequired', False),
-                'UserID': user.get('id', '')
-            }
-            
-            # Get visible apps count
-            visible_apps = relationships.get('visibleApps', {})
-            processed_user['VisibleAppsCount'] = get_visible_apps_count(visible_apps)
-            
-            processed_users.append(processed_user)
+        # Look up each user's attributes once, then fill every column as a typed array of known length
+        n_users = len(users_data)
+        user_attributes = [user.get('attributes', {}) for user in users_data]
         
-        df = pd.DataFrame(processed_users)
+        def attribute_column(name, default, dtype=object):
+            values = (attributes.get(name, default) for attributes in user_attributes)
+            return np.fromiter(values, dtype=dtype, count=n_users)
         
-        # Parse roles for better display
-        df['Parsed_Roles'] = df['Roles'].apply(parse_ios_roles)
+        emails = attribute_column('email', '')
+        usernames = attribute_column('username', '')
+        first_names = attribute_column('firstName', '')
+        last_names = attribute_column('lastName', '')
+        roles = attribute_column('roles', [])
+        all_apps_visible = attribute_column('allAppsVisible', False, dtype=np.bool_)
+        provisioning_allowed = attribute_column('provisioningAllowed', False, dtype=np.bool_)
+        email_vetting_required = attribute_column('emailVettingRequired', False, dtype=np.bool_)
+        user_ids = np.fromiter((user.get('id', '') for user in users_data), dtype=object, count=n_users)
+        visible_apps_counts = np.fromiter(
+            (get_visible_apps_count(user.get('relationships', {}).get('visibleApps', {})) for user in users_data),
+            dtype=np.int32,
+            count=n_users
+        )
         
-        # Create readable summary columns
-        df['Roles Count'] = df['Parsed_Roles'].apply(len)
-        df['Access Review'] = df.apply(analyze_ios_user, axis=1)
+        df = pd.DataFrame({
+            'Email': emails,
+            'Username': usernames,
+            'FirstName': first_names,
+            'LastName': last_names,
+            'Roles': roles,
+            'allAppsVisible': all_apps_visible,
+            'provisioningAllowed': provisioning_allowed,
+            'emailVettingRequired': email_vetting_required,
+            'UserID': user_ids,
+            'VisibleAppsCount': visible_apps_counts,
+        }, copy=False)
+        # Arrow-backed strings keep identifiers in one contiguous buffer instead of per-cell objects
+        df = df.astype({
+            'Email': 'string[pyarrow]',
+            'Username': 'string[pyarrow]',
+            'FirstName': 'string[pyarrow]',
+            'LastName': 'string[pyarrow]',
+            'UserID': 'string[pyarrow]',
+        })
         
-        # Always recalculate dangerous_users using the current dangerous_ios_roles from settings
-        # Use dangerous_users for the table and expanders
-        # The exporter/export_df should always export the full user list (df), not dangerous_users
-        dangerous_roles = set([r.upper() for r in st.session_state.dangerous_ios_roles])
-        dangerous_users = df[df['Parsed_Roles'].apply(lambda roles: any(role.upper() in dangerous_roles for role in roles))].copy().reset_index(drop=True)
+        # Normalize all roles in one long-form Arrow column, then regroup them per user
+        roles = df['Roles'].explode()
+        roles = roles[roles.notna() & (roles != 'None')].astype('string[pyarrow]').str.strip().str.upper()
+        roles = roles[roles != ''].sort_values()
+        roles = roles[~pd.MultiIndex.from_arrays([roles.index, roles]).duplicated()]
+        roles_by_user = roles.groupby(level=0)
+        # Cast to object first: with no roles at all the aggregate keeps the string dtype and cannot hold sets
+        df['Parsed_Roles'] = roles_by_user.agg(frozenset).astype(object).reindex(df.index, fill_value=frozenset())
         
-        return df
+        # Create readable summary columns
+        df['Roles Count'] = roles_by_user.nunique().reindex(df.index, fill_value=0)
+        # Pack each user's roles into a uint64 bitmask when the observed vocabulary fits,
+        # otherwise role checks fall back to set intersection on Parsed_Roles
+        role_codes, role_vocabulary = pd.factorize(roles, sort=True)
+        role_bits = None
+        if len(role_vocabulary) <= 64:
+            role_masks = np.zeros(n_users, dtype=np.uint64)
+            role_flags = np.left_shift(np.uint64(1), role_codes.astype(np.uint64))
+            np.bitwise_or.at(role_masks, roles.index.to_numpy(), role_flags)
+            df['RoleMask'] = role_masks
+            role_bits = {role: 1 << bit for bit, role in enumerate(role_vocabulary)}
+        # Roles as a display string for CSV export
+        df['Roles_String'] = (
+            roles_by_user.agg(', '.join)
+            .reindex(df.index, fill_value='None').astype('string[pyarrow]')
+        )
+        
+        return df, role_bits
     except Exception as e:
         st.error(f"Error processing JSON file: {str(e)}")
-        return None
+        return None, None
 
 def reprocess_ios_analysis():
-    if 'df' in st.session_state:
-        st.session_state.df['Access Review'] = st.session_state.df.apply(analyze_ios_user, axis=1)
+    if st.session_state.get('df') is not None:
+        refresh_dangerous_flags(st.session_state.df)
 
 # Place this at the top level, with other helpers
 
@@ -182,9 +250,13 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
         st.session_state.uploaded_file = uploaded_file
         # Process data and store in session state
         if 'df' not in st.session_state or st.session_state.get('uploaded_file_name') != uploaded_file.name:
-            st.session_state.df = load_and_process_ios_data(uploaded_file)
+            # file_id is unique per upload, so it keys the role analysis cache across sessions
+            st.session_state.df_version = uploaded_file.file_id
+            # The role-to-bit map lives next to df_version rather than in DataFrame metadata
+            st.session_state.df, st.session_state.role_bits = load_and_process_ios_data(uploaded_file)
             st.session_state.uploaded_file_name = uploaded_file.name
             if st.session_state.df is not None:
+                reprocess_ios_analysis()
                 st.rerun()
     
     if 'df' in st.session_state and st.session_state.df is not None:
@@ -193,76 +265,63 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
         st.markdown("---")
         st.header("🚨 Account Risk Analysis")
         
-        # === iOS ORGANIZATIONAL TAKEOVER ROLES ===
-        IOS_ORG_TAKEOVER_ROLES = {
-            'ADMIN',
-            'ACCOUNT_HOLDER',
-        }
-        
-        def has_account_level_access(user_roles):
-            admin_account_roles = set(p.replace(' ', '').upper() for p in st.session_state.dangerous_ios_roles)
-            for role in user_roles:
-                role_norm = role.replace(' ', '').upper()
-                for admin_role in admin_account_roles:
-                    if admin_role in role_norm:
-                        return True
-            return False
-        
-        def has_org_takeover_role(user_roles):
-            org_takeover_roles = set(p.replace(' ', '').upper() for p in IOS_ORG_TAKEOVER_ROLES)
-            for role in user_roles:
-                role_norm = role.replace(' ', '').upper()
-                if any(org_role in role_norm for org_role in org_takeover_roles):
-                    return True
-            return False
-        
-        dangerous_roles = set([r.upper() for r in st.session_state.dangerous_ios_roles])
-        dangerous_users = df[df['Parsed_Roles'].apply(lambda roles: any(role.upper() in dangerous_roles for role in roles))].copy().reset_index(drop=True)
+        # Normalized once per render and shared by every check below
+        norm_dangerous = get_normalized_dangerous_ios_roles()
+        refresh_dangerous_flags(df, norm_dangerous)
         
         # --- BADGE SUMMARY UI ---
         from streamlit.components.v1 import html
         
-        # Collect user lists
-        critical_users = dangerous_users
-        all_apps_visible_users = df[df['allAppsVisible'] == True]
-        provisioning_users = df[df['provisioningAllowed'] == True]
+        # Risk masks are shared by the badge counts and the email lists, so no filtered copies are built
+        m_critical = df['has_dangerous'].to_numpy(dtype=bool)
+        m_apps = df['allAppsVisible'].to_numpy(dtype=bool)
+        m_prov = df['provisioningAllowed'].to_numpy(dtype=bool)
+        critical_count = int(m_critical.sum())
+        apps_count = int(m_apps.sum())
+        prov_count = int(m_prov.sum())
+        emails = df['Email'].to_numpy()
         
-        # Badge style helper
+        # Badge style helper; the CSS has no placeholders, so only the counts row is an f-string
         badge_css = """
         <style>
-        .badge-row {{display: flex; gap: 1.5rem; margin-bottom: 1.5rem;}}
-        .badge {{
+        .badge-row {display: flex; gap: 1.5rem; margin-bottom: 1.5rem;}
+        .badge {
           display: inline-flex; align-items: center; font-size: 1.1rem; font-weight: 600;
           border-radius: 2em; padding: 0.5em 1.2em; margin-right: 0.5em; margin-bottom: 0.2em;
           color: #fff; box-shadow: 0 1px 4px rgba(0,0,0,0.07);
-        }}
-        .badge.critical {{background: #e74c3c;}}
-        .badge.apps {{background: #f39c12;}}
-        .badge.prov {{background: #2980b9;}}
-        .badge .count {{margin-left: 0.5em; font-size: 1.2em; font-weight: bold;}}
+        }
+        .badge.critical {background: #e74c3c;}
+        .badge.apps {background: #f39c12;}
+        .badge.prov {background: #2980b9;}
+        .badge .count {margin-left: 0.5em; font-size: 1.2em; font-weight: bold;}
         </style>
+        """
+        # Streamlit drops elements that are not re-emitted, so the HTML is always rendered but only rebuilt on new counts
+        badge_counts = (critical_count, apps_count, prov_count)
+        if st.session_state.get('_badge_counts') != badge_counts:
+            st.session_state['_badge_html'] = badge_css + f"""
         <div class="badge-row">
           <div class="badge critical">🔴 Critical <span class="count">{critical_count}</span></div>
           <div class="badge apps">⚠️ All Apps Visible <span class="count">{apps_count}</span></div>
           <div class="badge prov">🔧 Provisioning <span class="count">{prov_count}</span></div>
         </div>
-        """.format(
-            critical_count=len(critical_users),
-            apps_count=len(all_apps_visible_users),
-            prov_count=len(provisioning_users)
-        )
-        html(badge_css, height=60)
+        """
+            st.session_state['_badge_counts'] = badge_counts
+        html(st.session_state['_badge_html'], height=60)
         
         # Expanders for user lists
-        with st.expander(f"🔴 Critical Users ({len(critical_users)})"):
-            st.write(", ".join(critical_users['Email'].tolist()) if not critical_users.empty else "None")
-        with st.expander(f"⚠️ All Apps Visible Users ({len(all_apps_visible_users)})"):
-            st.write(", ".join(all_apps_visible_users['Email'].tolist()) if not all_apps_visible_users.empty else "None")
-        with st.expander(f"🔧 Provisioning Users ({len(provisioning_users)})"):
-            st.write(", ".join(provisioning_users['Email'].tolist()) if not provisioning_users.empty else "None")
+        with st.expander(f"🔴 Critical Users ({critical_count})"):
+            st.write(", ".join(emails[m_critical]) if critical_count else "None")
+        with st.expander(f"⚠️ All Apps Visible Users ({apps_count})"):
+            st.write(", ".join(emails[m_apps]) if apps_count else "None")
+        with st.expander(f"🔧 Provisioning Users ({prov_count})"):
+            st.write(", ".join(emails[m_prov]) if prov_count else "None")
         
         # --- END BADGE SUMMARY ---
         
+        # Only materialized for the table and the per-user inspector below
+        dangerous_users = df[m_critical]
+        
         st.subheader("🚨 Risk Assessment")
         display_df = dangerous_users[['Email', 'allAppsVisible', 'provisioningAllowed']].copy()
         display_df = display_df.rename(columns={
@@ -273,14 +332,19 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
         
         # User-by-user expander section
         st.subheader('🔍 Inspect Users with Potentially Dangerous Roles')
-        for idx, user in dangerous_users.iterrows():
-            with st.expander(user['Email']):
-                role_tags = [
-                    f"<span style='background:#e74c3c;color:#fff;padding:2px 10px;border-radius:1em;margin-right:4px;font-size:1em;'>🔴 {role}</span>"
-                    for role in user['Parsed_Roles'] if role.upper() in dangerous_roles
-                ]
-                if role_tags:
-                    st.markdown(' '.join(role_tags), unsafe_allow_html=True)
+        # Tag style is injected once so each role tag only carries a class name
+        st.markdown(
+            "<style>.danger-tag{background:#e74c3c;color:#fff;padding:2px 10px;border-radius:1em;margin-right:4px;font-size:1em;}</style>",
+            unsafe_allow_html=True
+        )
+        for user in dangerous_users[['Email', 'Parsed_Roles']].itertuples(index=False):
+            with st.expander(user.Email):
+                user_dangerous_roles = user.Parsed_Roles & norm_dangerous
+                if user_dangerous_roles:
+                    st.markdown(
+                        ' '.join('<span class="danger-tag">🔴 ' + role + '</span>' for role in sorted(user_dangerous_roles)),
+                        unsafe_allow_html=True
+                    )
                 else:
                     st.markdown('*No Potentially Dangerous Roles*', unsafe_allow_html=True)
         
@@ -291,15 +355,19 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
         # Exporter/export_df should always export the full user list (df)
         export_df = prepare_export_data(df)
         
+        # One timestamp per script run, shared by both export file names
+        ts_str = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Export all users
-            csv_all = export_df.to_csv(index=False)
+            # Export columns do not depend on the monitored roles, so the upload id is enough
+            csv_all = build_csv(st.session_state.get('df_version'), export_df)
             st.download_button(
                 label="📁 Export All Users (CSV)",
                 data=csv_all,
-                file_name=f"appstore_connect_users_all_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"appstore_connect_users_all_{ts_str}.csv",
                 mime="text/csv",
                 help="Download all users with risk analysis as CSV"
             )
@@ -307,11 +375,13 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
         with col2:
             # Export currently filtered users
             if 'filtered_export_data' in st.session_state and st.session_state.filtered_export_data is not None:
-                csv_filtered = st.session_state.filtered_export_data.to_csv(index=False)
+                filtered_export_data = st.session_state.filtered_export_data
+                filtered_signature = int(pd.util.hash_pandas_object(filtered_export_data, index=False).sum())
+                csv_filtered = build_csv(filtered_signature, filtered_export_data)
                 st.download_button(
                     label=f"📊 Export Filtered ({st.session_state.filtered_export_count} users)",
                     data=csv_filtered,
-                    file_name=f"appstore_connect_users_filtered_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"appstore_connect_users_filtered_{ts_str}.csv",
                     mime="text/csv",
                     help="Download filtered users based on selected risk levels"
                 )
@@ -319,7 +389,7 @@ if 'current_page' not in st.session_state or st.session_state.current_page == "W
                 pass
         
         # Show export summary
-        st.info(f"📋 **Export Summary**: {len(export_df)} total users, {len(dangerous_users)} users with dangerous roles")
+        st.info(f"📋 **Export Summary**: {len(export_df)} total users, {critical_count} users with dangerous roles")
 
 elif 'current_page' in st.session_state and st.session_state.current_page == "Settings":
     st.title("⚙️ Settings")
@@ -377,37 +447,32 @@ elif 'current_page' in st.session_state and st.session_state.current_page == "Se
     dangerous_roles = st.session_state.dangerous_ios_roles.copy()
     st.caption(f"Currently monitoring {len(dangerous_roles)} roles.")
     
+    known_roles = set(dangerous_roles)
+    for preset_roles in presets.values():
+        if preset_roles:
+            known_roles |= preset_roles
+    if st.session_state.get('df') is not None:
+        known_roles = known_roles.union(*st.session_state.df['Parsed_Roles'])
+    
     col1, col2 = st.columns([2, 1])
     with col1:
-        if dangerous_roles:
-            roles_to_remove = []
-            for i, role in enumerate(sorted(dangerous_roles)):
-                col_role, col_btn = st.columns([5, 1])
-                with col_role:
-                    st.write(f"• {role}")
-                with col_btn:
-                    if st.button("❌", key=f"remove_{i}", help=f"Remove {role}"):
-                        roles_to_remove.append(role)
-            for role in roles_to_remove:
-                st.session_state.dangerous_ios_roles.discard(role)
-                if 'df' in st.session_state:
-                    reprocess_ios_analysis()
-                st.rerun()
-        else:
+        selected_roles = st.multiselect(
+            "Monitored roles:",
+            options=sorted(known_roles),
+            default=sorted(dangerous_roles),
+            accept_new_options=True,
+            placeholder="e.g., DEVELOPER",
+            help="Remove a role to stop monitoring it, or type a new role name to add it"
+        )
+        new_selection = {role.strip().upper() for role in selected_roles if role.strip()}
+        if new_selection != dangerous_roles:
+            st.session_state.dangerous_ios_roles = new_selection
+            reprocess_ios_analysis()
+            st.rerun()
+        if not dangerous_roles:
             st.info("No roles currently being monitored.")
     
     with col2:
-        new_role = st.text_input("Add role:", placeholder="e.g., DEVELOPER")
-        if st.button("Add", key="add_role_btn"):
-            if new_role and new_role.strip():
-                st.session_state.dangerous_ios_roles.add(new_role.strip().upper())
-                if 'df' in st.session_state:
-                    reprocess_ios_analysis()
-                st.success(f"Added: {new_role.strip().upper()}")
-                st.rerun()
-            else:
-                st.error("Please enter a valid role name")
-        
         if st.button("Reset to Preset", key="reset_preset_btn"):
             if selected_preset != "Custom" and presets[selected_preset]:
                 st.session_state.dangerous_ios_roles = presets[selected_preset].copy()